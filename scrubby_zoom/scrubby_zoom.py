@@ -19,14 +19,78 @@ This script:
 
 from krita import Extension, Krita
 from PyQt5.QtWidgets import QApplication, QStatusBar, QLabel, QComboBox, QLineEdit, QToolButton
-from PyQt5.QtCore import Qt, QEvent, QObject
+from PyQt5.QtCore import Qt, QEvent, QObject, QTimer, QElapsedTimer
 from PyQt5.QtGui import QCursor, QPixmap
+import bisect
+import collections
+import functools
+import math
 import os
 import re
 
 
 REFERENCE_DPI = 72.0  # Krita/Calligra zoom infrastructure historically assumes 72dpi as "1:1"
 
+# Zoom clamp in ZOOM_CONSTANT scale (1% .. 25600%)
+MIN_ZOOM_SCALE = 0.01
+MAX_ZOOM_SCALE = 256.0
+
+# Max documents remembered in the per-document zoom cache
+_CACHE_CAP = 64
+
+# Shipped cursor icon sizes (Icons/zoomin<size>.png), ascending
+_CURSOR_SIZES = (24, 32, 48, 64, 96)
+
+# Key releases this soon after activation are not treated as the shortcut release
+DEACTIVATE_GRACE_MS = 50
+
+# Pure percent token in a zoom widget, e.g. '66.7%'
+_PERCENT_RE = re.compile(r'^\s*([\d.]+)\s*%\s*$')
+# Zoom suffix in the window title, e.g. 'image.kra @ 66.7%'
+_TITLE_PERCENT_RE = re.compile(r'@\s*([\d.]+)\s*%')
+
+
+def _get_cursor_icon_path(plugin_dir, dpr):
+    icons_dir = os.path.join(plugin_dir, "Icons")
+
+    # Smallest icon at least as large as the physical cursor size
+    target_physical_size = int(24 * dpr)
+    i = bisect.bisect_left(_CURSOR_SIZES, target_physical_size)
+    best_size = _CURSOR_SIZES[min(i, len(_CURSOR_SIZES) - 1)]
+
+    cursor_path = os.path.join(icons_dir, f"zoomin{best_size}.png")
+    if not os.path.exists(cursor_path):
+        # Fall back to the visually closest icon that exists
+        for size in sorted(_CURSOR_SIZES, key=lambda sz: abs(sz - target_physical_size)):
+            fallback_path = os.path.join(icons_dir, f"zoomin{size}.png")
+            if os.path.exists(fallback_path):
+                cursor_path = fallback_path
+                best_size = size
+                break
+
+    return cursor_path, best_size
+
+
+@functools.lru_cache(maxsize=8)
+def _build_zoom_cursor(plugin_dir, dpr_hundredths):
+    """
+    Build the zoom cursor for a DPR given in hundredths (a stable, hashable key).
+    Module level so plugin re-instantiation and screen DPR changes within a Krita
+    session reuse already built cursors instead of probing and decoding icons again.
+    """
+    dpr = dpr_hundredths / 100.0
+    try:
+        cursor_path, icon_size = _get_cursor_icon_path(plugin_dir, dpr)
+        if os.path.exists(cursor_path):
+            pixmap = QPixmap(cursor_path)
+            if not pixmap.isNull():
+                pixmap.setDevicePixelRatio(dpr)
+                hotspot = int(icon_size / (4 * dpr))
+                return QCursor(pixmap, hotspot, hotspot)
+    except Exception:
+        pass
+    return QCursor(Qt.SizeHorCursor)
+
 
 class ZoomEventFilter(QObject):
     def __init__(self, extension):
@@ -74,10 +138,16 @@ class ZoomEventFilter(QObject):
                 self.ext.end_drag()
                 return True
 
-        # Deactivate on shortcut release (best-effort: any non-auto-repeat key release)
+        # Deactivate on shortcut release (best-effort: any non-auto-repeat key release
+        # once the activation grace period has passed)
         elif t == QEvent.KeyRelease:
             if not event.isAutoRepeat():
-                self.ext.deactivate_zoom_mode()
+                if self.ext._activate_elapsed.elapsed() > DEACTIVATE_GRACE_MS:
+                    self.ext.deactivate_zoom_mode()
+                else:
+                    # Too early to trust; re-check once the grace period is over so a
+                    # quickly released shortcut doesn't leave zoom mode stuck on
+                    QTimer.singleShot(DEACTIVATE_GRACE_MS, self.ext._deactivate_if_keys_released)
                 return False
 
         return False
@@ -91,23 +161,57 @@ class ScrubbyZoomExtension(Extension):
         self.is_dragging = False
 
         self.drag_start_x = 0
+        self._last_delta_x = None
+        # Horizontal delta range that maps onto the zoom clamp for the current drag
+        self._dx_min = 0.0
+        self._dx_max = 0.0
         self.active_view = None
+        self._active_canvas = None
+        self._active_doc_id = None
 
         # Store zoom in ZOOM_CONSTANT scale (1.0 == 100%)
         self.initial_zoom_scale = 1.0
         self.last_set_zoom_scale = None
 
-        # Per-document last known zoom scale (ZOOM_CONSTANT)
-        self.document_zoom_cache = {}
+        # How canvas.zoomLevel() was interpreted for the current document
+        # (raw vs DPI-corrected), reused by later drags while the mode is active.
+        # Only set from document-level evidence (UI comparison or 72 dpi).
+        self._drag_mode_doc_id = None
+        self._drag_dpi_factor = 1.0
+        self._drag_use_corrected = False
+
+        # Per-document last known zoom scale (ZOOM_CONSTANT), least recently used first
+        self.document_zoom_cache = collections.OrderedDict()
 
         # Sensitivity: pixels per doubling/halving
         self.zoom_sensitivity = 150.0
-
+        # ln(2)/sensitivity, so 2^(dx/sensitivity) == exp(dx * _ln2_over_sens)
+        self._ln2_over_sens = math.log(2.0) / self.zoom_sensitivity
+
+        # Coalesce MouseMove bursts so the canvas is re-zoomed at most once per frame
+        self._pending_scale = None
+        self._coalesce_timer = QTimer()
+        self._coalesce_timer.setSingleShot(True)
+        self._coalesce_timer.setInterval(16)
+        self._coalesce_timer.timeout.connect(self._flush_pending_zoom)
+
+        # Resolved zoom widget and the window it was found in. Holding the window
+        # keeps its wrapper alive, so an identity check tells windows apart.
+        self._cached_zoom_widget = None
+        self._cached_zoom_qwin = None
+
+        # Time since activate_zoom_mode, used to ignore stray early key releases
+        self._activate_elapsed = QElapsedTimer()
+
+        # Installed application-wide only while zoom mode is active, so an idle
+        # Krita does not route every event through Python
         self.event_filter = ZoomEventFilter(self)
         self.filter_installed = False
 
+        # Loaded on first activation to keep icon I/O out of Krita startup,
+        # and reloaded when the screen DPR it was built for changes
         self.zoom_cursor = None
-        self._load_cursor()
+        self._cursor_dpr = None
 
     def setup(self):
         pass
@@ -123,72 +227,41 @@ class ScrubbyZoomExtension(Extension):
     # ----------------------------
     # Cursor loading (kept from your variant)
     # ----------------------------
-    def _get_cursor_icon_path(self):
-        plugin_dir = os.path.dirname(os.path.realpath(__file__))
-        icons_dir = os.path.join(plugin_dir, "Icons")
-        available_sizes = [24, 32, 48, 64, 96]
-
+    def _screen_dpr(self):
         try:
             screen = QApplication.primaryScreen()
-            dpr = screen.devicePixelRatio() if screen else 1.0
+            return screen.devicePixelRatio() if screen else 1.0
         except Exception:
-            dpr = 1.0
-
-        target_physical_size = int(24 * dpr)
-        best_size = available_sizes[-1]
-        for size in available_sizes:
-            if size >= target_physical_size:
-                best_size = size
-                break
-
-        cursor_path = os.path.join(icons_dir, f"zoomin{best_size}.png")
-        if not os.path.exists(cursor_path):
-            for size in available_sizes:
-                fallback_path = os.path.join(icons_dir, f"zoomin{size}.png")
-                if os.path.exists(fallback_path):
-                    cursor_path = fallback_path
-                    best_size = size
-                    break
-
-        return cursor_path, best_size, dpr
+            return 1.0
 
-    def _load_cursor(self):
-        try:
-            cursor_path, icon_size, dpr = self._get_cursor_icon_path()
-            if os.path.exists(cursor_path):
-                pixmap = QPixmap(cursor_path)
-                if not pixmap.isNull():
-                    pixmap.setDevicePixelRatio(dpr)
-                    hotspot = int(icon_size / (4 * dpr))
-                    self.zoom_cursor = QCursor(pixmap, hotspot, hotspot)
-                    return
-        except Exception:
-            pass
-        self.zoom_cursor = QCursor(Qt.SizeHorCursor)
+    def _load_cursor(self, dpr):
+        self._cursor_dpr = dpr
+        plugin_dir = os.path.dirname(os.path.realpath(__file__))
+        self.zoom_cursor = _build_zoom_cursor(plugin_dir, int(round(dpr * 100)))
 
     # ----------------------------
     # Utilities
     # ----------------------------
-    def _has_active_document(self):
-        app = Krita.instance()
-        try:
-            return bool(app and app.activeWindow() and app.activeWindow().activeView() and app.activeDocument())
-        except Exception:
-            return False
-
-    def _get_current_view(self):
+    def _resolve_active(self):
+        """Return (window, view, document), each None when unavailable."""
         try:
             app = Krita.instance()
-            if app and app.activeWindow():
-                return app.activeWindow().activeView()
+            win = app.activeWindow() if app else None
+            view = win.activeView() if win else None
+            doc = app.activeDocument() if app else None
+            return win, view, doc
         except Exception:
-            pass
-        return None
+            return None, None, None
+
+    def _has_active_document(self):
+        win, view, doc = self._resolve_active()
+        return bool(win and view and doc)
 
-    def _get_document_id(self):
-        """Best-effort stable id for caching."""
+    def _get_document_id(self, doc=None):
+        """Best-effort stable id for caching (defaults to the active document)."""
         try:
-            doc = Krita.instance().activeDocument()
+            if doc is None:
+                doc = Krita.instance().activeDocument()
             if not doc:
                 return None
             fname = doc.fileName()
@@ -198,40 +271,40 @@ class ScrubbyZoomExtension(Extension):
         except Exception:
             return None
 
+    def _cache_put(self, doc_id, scale):
+        c = self.document_zoom_cache
+        c[doc_id] = scale
+        c.move_to_end(doc_id)
+        while len(c) > _CACHE_CAP:
+            c.popitem(last=False)
+
     def _event_global_pos(self, event):
         """Support different event types safely."""
-        try:
+        if hasattr(event, "globalPos"):
             return event.globalPos()
-        except Exception:
-            try:
-                # Some events expose globalPosF()
-                return event.globalPosF().toPoint()
-            except Exception:
-                return None
+        if hasattr(event, "globalPosF"):
+            # Some events only expose globalPosF()
+            return event.globalPosF().toPoint()
+        return None
 
     # ----------------------------
     # Zoom reading (core fix)
     # ----------------------------
     def _doc_dpi(self, view):
-        try:
-            doc = view.document() if view else None
-            if doc:
-                dpi = float(doc.resolution())
-                if dpi > 0:
-                    return dpi
-        except Exception:
-            pass
-        return REFERENCE_DPI
+        if view is None:
+            return REFERENCE_DPI
+        doc = view.document()
+        if doc is None:
+            return REFERENCE_DPI
+        dpi = float(doc.resolution())
+        return dpi if dpi > 0 else REFERENCE_DPI
 
     def _canvas_zoom_raw(self, view):
         """Raw canvas.zoomLevel() (may be DPI-scaled)."""
-        try:
-            canvas = view.canvas() if view else None
-            if canvas:
-                return float(canvas.zoomLevel())
-        except Exception:
-            pass
-        return None
+        if view is None:
+            return None
+        canvas = view.canvas()
+        return float(canvas.zoomLevel()) if canvas is not None else None
 
     def _canvas_zoom_corrected(self, raw_zoom, dpi):
         """
@@ -246,10 +319,52 @@ class ScrubbyZoomExtension(Extension):
         except Exception:
             return raw_zoom
 
+    def _read_percent_text(self, widget):
+        """Return the pure percent value shown by a widget (e.g. 66.7), else None."""
+        if isinstance(widget, QComboBox):
+            text = widget.currentText()
+        else:  # QLineEdit, QToolButton, QLabel
+            text = widget.text()
+
+        if not text:
+            return None
+        m = _PERCENT_RE.match(text)
+        if not m:
+            return None
+        return float(m.group(1))
+
+    def _named_zoom(self, widget):
+        try:
+            obj_name = (widget.objectName() or "").lower()
+            acc_name = (widget.accessibleName() or "").lower()
+        except Exception:
+            return False
+        return "zoom" in obj_name or "zoom" in acc_name
+
+    def _scan_percent_widgets(self, qwin, widgets):
+        """
+        Return the scale of the first visible widget showing a pure percent token and
+        cache it. Krita keeps a hidden zoom widget per inactive view, still showing
+        that view's zoom, so hidden widgets are skipped.
+        """
+        for w in widgets:
+            try:
+                if not w.isVisible():
+                    continue
+                val = self._read_percent_text(w)
+            except Exception:
+                continue
+            if val is not None:
+                self._cached_zoom_widget = w
+                self._cached_zoom_qwin = qwin
+                return val / 100.0
+        return None
+
     def _zoom_scale_from_ui(self):
         """
         Try to find the *actual zoom widget* showing values like '66.7%'.
         This avoids accidentally reading unrelated '%'-labels (opacity, etc.).
+        The resolved widget is cached per window so repeat reads skip the tree walk.
         """
         try:
             win = Krita.instance().activeWindow()
@@ -259,53 +374,41 @@ class ScrubbyZoomExtension(Extension):
             if not qwin:
                 return None
 
-            # 1) Prefer widgets whose object/accessibility names suggest zoom.
-            candidates = []
-            for w in qwin.findChildren((QComboBox, QLineEdit, QToolButton, QLabel)):
-                try:
-                    obj_name = (w.objectName() or "").lower()
-                    acc_name = (w.accessibleName() or "").lower()
-                    if "zoom" in obj_name or "zoom" in acc_name:
-                        candidates.append(w)
-                except Exception:
-                    continue
-
-            # 2) If none found, scan status bar children only (not the whole window),
-            # but STILL require the text be a pure percent token.
-            if not candidates:
-                status_bar = qwin.findChild(QStatusBar)
-                if status_bar:
-                    candidates = status_bar.findChildren((QComboBox, QLineEdit, QToolButton, QLabel))
-
-            def read_percent_text(widget):
+            # 0) Cached widget from a previous scan of this same window, if it still
+            # belongs to the active view (hidden once another view is activated).
+            cached = self._cached_zoom_widget
+            if cached is not None and qwin is self._cached_zoom_qwin:
                 try:
-                    if isinstance(widget, QComboBox):
-                        text = widget.currentText()
-                    elif isinstance(widget, QLineEdit):
-                        text = widget.text()
-                    elif isinstance(widget, QToolButton):
-                        text = widget.text()
-                    else:  # QLabel
-                        text = widget.text()
-                except Exception:
-                    return None
-
-                if not text:
-                    return None
-                m = re.match(r'^\s*([\d.]+)\s*%\s*$', text)
-                if not m:
-                    return None
-                return float(m.group(1))
-
-            # Pick the first good pure-percent token from candidates.
-            for w in candidates:
-                val = read_percent_text(w)
+                    val = self._read_percent_text(cached) if cached.isVisible() else None
+                except RuntimeError:
+                    # Underlying C++ widget was deleted
+                    val = None
                 if val is not None:
                     return val / 100.0
+            self._cached_zoom_widget = None
+            self._cached_zoom_qwin = None
+
+            # 1) The zoom widget is a combobox. Prefer ones whose object/accessibility
+            # names suggest zoom, then accept any showing a pure percent token.
+            combos = qwin.findChildren(QComboBox)
+            val = self._scan_percent_widgets(qwin, (c for c in combos if self._named_zoom(c)))
+            if val is None:
+                val = self._scan_percent_widgets(qwin, combos)
+            if val is not None:
+                return val
+
+            # 2) Otherwise scan status bar children only (not the whole window),
+            # but STILL require the text be a pure percent token.
+            status_bar = qwin.findChild(QStatusBar)
+            if status_bar:
+                val = self._scan_percent_widgets(
+                    qwin, status_bar.findChildren((QLineEdit, QToolButton, QLabel)))
+                if val is not None:
+                    return val
 
             # 3) As a last resort, parse window title if it contains '@ xx%'.
             title = qwin.windowTitle() or ""
-            m = re.search(r'@\s*([\d.]+)\s*%', title)
+            m = _TITLE_PERCENT_RE.search(title)
             if m:
                 return float(m.group(1)) / 100.0
 
@@ -314,33 +417,45 @@ class ScrubbyZoomExtension(Extension):
 
         return None
 
-    def _get_current_zoom_scale(self, view):
+    def _resolve_zoom_scale(self, view):
         """
-        Return best estimate of current zoom in ZOOM_CONSTANT scale.
+        Return (scale, dpi_factor, use_corrected) where scale is the best estimate
+        of current zoom in ZOOM_CONSTANT scale and use_corrected tells whether
+        canvas.zoomLevel() had to be divided by dpi_factor to get it.
+        use_corrected is None when the choice is not a property of the document
+        (canvas unreadable, or the no-UI heuristic, which depends on the raw value).
         Strategy:
-          - Read UI zoom scale if available (ground truth)
-          - Read raw canvas.zoomLevel()
+          - Read raw canvas.zoomLevel(); at 72 dpi it needs no correction
+          - Otherwise read UI zoom scale if available (ground truth)
           - Compare raw vs corrected vs UI, choose closest to UI when UI exists
           - If UI missing, choose corrected unless raw is clearly already sane
         """
-        ui_scale = self._zoom_scale_from_ui()
-
         raw = self._canvas_zoom_raw(view)
         if raw is None:
-            # fallback: cache or default
+            # fallback: cache, UI or default
             doc_id = self._get_document_id()
             if doc_id and doc_id in self.document_zoom_cache:
-                return self.document_zoom_cache[doc_id]
-            return ui_scale if ui_scale is not None else 1.0
+                return self.document_zoom_cache[doc_id], 1.0, None
+            ui_scale = self._zoom_scale_from_ui()
+            return (ui_scale if ui_scale is not None else 1.0), 1.0, None
 
         dpi = self._doc_dpi(view)
+        dpi_factor = dpi / REFERENCE_DPI
+
+        # Reference dpi: raw and corrected are identical, so the UI lookup can't change the answer.
+        if abs(dpi - REFERENCE_DPI) < 1e-3 and MIN_ZOOM_SCALE <= raw <= MAX_ZOOM_SCALE:
+            return raw, dpi_factor, False
+
+        ui_scale = self._zoom_scale_from_ui()
         corrected = self._canvas_zoom_corrected(raw, dpi)
 
         # If we have UI, pick the closer of raw vs corrected.
         if ui_scale is not None and ui_scale > 0:
             dr = abs(raw - ui_scale)
             dc = abs(corrected - ui_scale)
-            return corrected if dc <= dr else raw
+            if dc <= dr:
+                return corrected, dpi_factor, True
+            return raw, dpi_factor, False
 
         # No UI available: heuristic.
         # Many reports show the broken getter returns values "inflated" by dpi/72.
@@ -348,13 +463,13 @@ class ScrubbyZoomExtension(Extension):
         if abs(dpi - REFERENCE_DPI) > 1e-3:
             # If raw is extremely large for typical viewing (but corrected is reasonable), prefer corrected.
             if raw > 10.0 and corrected <= 10.0:
-                return corrected
+                return corrected, dpi_factor, None
             # If corrected is absurdly tiny but raw is plausible, keep raw.
             if corrected < 0.01 and raw >= 0.01:
-                return raw
-            return corrected
+                return raw, dpi_factor, None
+            return corrected, dpi_factor, None
 
-        return raw
+        return raw, dpi_factor, False
 
     # ----------------------------
     # Mode lifecycle
@@ -364,23 +479,45 @@ class ScrubbyZoomExtension(Extension):
             return
 
         self.zoom_mode_active = True
+        self._activate_elapsed.start()
         self.is_dragging = False
         self.active_view = None
+        self._active_canvas = None
+        self._active_doc_id = None
         self.last_set_zoom_scale = None
 
+        dpr = self._screen_dpr()
+        if self.zoom_cursor is None or dpr != self._cursor_dpr:
+            self._load_cursor(dpr)
         QApplication.setOverrideCursor(self.zoom_cursor)
 
         if not self.filter_installed:
             QApplication.instance().installEventFilter(self.event_filter)
             self.filter_installed = True
 
+    def _deactivate_if_keys_released(self):
+        if not self.zoom_mode_active or self._activate_elapsed.elapsed() < DEACTIVATE_GRACE_MS:
+            return
+        if QApplication.queryKeyboardModifiers() == Qt.NoModifier:
+            self.deactivate_zoom_mode()
+
     def deactivate_zoom_mode(self):
         if not self.zoom_mode_active:
             return
 
+        if self.is_dragging:
+            self.end_drag()
+
         self.zoom_mode_active = False
         self.is_dragging = False
         self.active_view = None
+        self._active_canvas = None
+        self._active_doc_id = None
+        self._drag_mode_doc_id = None
+
+        if self.filter_installed:
+            QApplication.instance().removeEventFilter(self.event_filter)
+            self.filter_installed = False
 
         try:
             QApplication.restoreOverrideCursor()
@@ -391,57 +528,110 @@ class ScrubbyZoomExtension(Extension):
     # Drag + zoom
     # ----------------------------
     def start_drag(self, global_pos):
-        if not self._has_active_document() or global_pos is None:
+        win, view, doc = self._resolve_active()
+        if not (win and view and doc) or global_pos is None:
             self.deactivate_zoom_mode()
             return
 
         self.is_dragging = True
         self.drag_start_x = int(global_pos.x())
-        self.active_view = self._get_current_view()
+        self.active_view = view
 
-        # Capture correct initial zoom scale for THIS view/document
-        zoom_scale = self._get_current_zoom_scale(self.active_view)
+        doc_id = self._get_document_id(doc)
+        self._active_doc_id = doc_id
 
-        # Persist cache per document
-        doc_id = self._get_document_id()
-        if doc_id:
-            self.document_zoom_cache[doc_id] = zoom_scale
+        # Capture correct initial zoom scale for THIS view/document.
+        # Repeat drags on the same document reuse the raw-vs-corrected decision
+        # and DPI factor instead of rescanning the UI and re-reading the resolution,
+        # but only when that decision came from the UI or the 72 dpi path.
+        # libkis calls below can raise; this runs inside eventFilter, so never let them escape.
+        try:
+            self._active_canvas = view.canvas()
+            raw = None
+            if doc_id and doc_id == self._drag_mode_doc_id:
+                raw = self._canvas_zoom_raw(view)
+            if raw is not None:
+                zoom_scale = raw / self._drag_dpi_factor if self._drag_use_corrected else raw
+            else:
+                zoom_scale, dpi_factor, use_corrected = self._resolve_zoom_scale(view)
+                if use_corrected is not None:
+                    self._drag_mode_doc_id = doc_id
+                    self._drag_dpi_factor = dpi_factor
+                    self._drag_use_corrected = use_corrected
+        except Exception:
+            zoom_scale = self.document_zoom_cache.get(doc_id, 1.0) if doc_id else 1.0
 
-        self.initial_zoom_scale = zoom_scale
         self.last_set_zoom_scale = zoom_scale
+        self._last_delta_x = 0
+
+        # Clamp in delta space: init * 2^(dx/sensitivity) hits the zoom limits here
+        init = max(MIN_ZOOM_SCALE, min(MAX_ZOOM_SCALE, zoom_scale))
+        self.initial_zoom_scale = init
+        self._dx_min = self.zoom_sensitivity * math.log2(MIN_ZOOM_SCALE / init)
+        self._dx_max = self.zoom_sensitivity * math.log2(MAX_ZOOM_SCALE / init)
 
     def update_zoom(self, global_pos):
         if not self.is_dragging or global_pos is None:
             return
 
-        view = self.active_view
-        if not view:
+        # QPoint coordinates are already ints
+        delta_x = global_pos.x() - self.drag_start_x
+        # Clamp (1% .. 25600%) in delta space, before any float math
+        delta_x = min(self._dx_max, max(self._dx_min, delta_x))
+        # Vertical-only, repeated or past-the-clamp events map to the same scale
+        if delta_x == self._last_delta_x:
             return
+        self._last_delta_x = delta_x
 
-        try:
-            canvas = view.canvas()
-            if not canvas:
-                return
-
-            delta_x = int(global_pos.x()) - int(self.drag_start_x)
+        # Exponential zoom: 2^(dx/sensitivity)
+        new_scale = self.initial_zoom_scale * math.exp(self._ln2_over_sens * delta_x)
 
-            # Exponential zoom: 2^(dx/sensitivity)
-            zoom_factor = 2.0 ** (float(delta_x) / float(self.zoom_sensitivity))
-            new_scale = float(self.initial_zoom_scale) * zoom_factor
+        # Skip when indistinguishable from what is already applied (or queued)
+        current = self._pending_scale
+        if current is None:
+            current = self.last_set_zoom_scale
+        if current is not None and abs(new_scale - current) / max(current, 1e-9) < 1e-4:
+            return
 
-            # Clamp (1% .. 25600%) in scale space
-            new_scale = max(0.01, min(256.0, new_scale))
+        # Applied by _flush_pending_zoom on the next timer tick
+        self._pending_scale = new_scale
+        timer = self._coalesce_timer
+        if not timer.isActive():
+            timer.start()
 
-            canvas.setZoomLevel(new_scale)
+    def _flush_pending_zoom(self):
+        new_scale = self._pending_scale
+        self._pending_scale = None
+        if new_scale is None:
+            return
 
-            self.last_set_zoom_scale = new_scale
-            doc_id = self._get_document_id()
-            if doc_id:
-                self.document_zoom_cache[doc_id] = new_scale
+        canvas = self._active_canvas
+        if not canvas:
+            return
 
+        try:
+            self._apply_scale(canvas, new_scale)
         except Exception:
             pass
 
+    def _apply_scale(self, canvas, scale):
+        """
+        Set the canvas zoom to a ZOOM_CONSTANT scale. Unlike zoomLevel(), the
+        setter is not DPI-scaled, so the scale is passed through in either mode.
+        """
+        canvas.setZoomLevel(scale)
+        self.last_set_zoom_scale = scale
+
     def end_drag(self):
+        # Apply the final position before the view is released
+        self._coalesce_timer.stop()
+        self._flush_pending_zoom()
+
+        doc_id = self._active_doc_id
+        if doc_id and self.last_set_zoom_scale is not None:
+            self._cache_put(doc_id, self.last_set_zoom_scale)
+
         self.is_dragging = False
         self.active_view = None
+        self._active_canvas = None
+        self._active_doc_id = None